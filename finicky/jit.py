@@ -0,0 +1,128 @@
+"""
+Bounds checks of `is_int` fields compiled to machine code with numba, for validating columns of ints in bulk.
+numba is an optional dependency, `compile` and `compile_field` return `None` when it isn't installed.
+"""
+from finicky.validators import _kind
+
+try:
+    import numba
+    import numpy
+except ImportError:  # numba is an optional dependency
+    numba = None
+
+# compiled checks keyed by which bounds of each column they check
+_COMPILED_CHECKS = {}
+
+
+def _compile_bounds_check(bounded, parallel=False):
+    """
+    Generates a function which checks a set of int columns against their bounds in a single pass over the rows and
+    compiles it with numba. The bounds are passed in as arguments rather than compiled in, so that columns with the same
+    bounds set share the compiled function whatever the values of those bounds.
+    :param bounded: A tuple of (has_min, has_max) pairs, one for each column
+    :param parallel: Whether the rows are split across threads
+    :return: A function which takes in the columns as numpy arrays of the same length followed by the bounds that are
+             set, in the order `_bound_values` lists them, and returns a 2d boolean array flagging the entries of each
+             column that are out of bounds.
+    """
+    compiled_check = _COMPILED_CHECKS.get((bounded, parallel))
+    if compiled_check is not None:
+        return compiled_check
+    columns = [f"c{index}" for index in range(len(bounded))]
+    limits = []
+    lines = [f"    flags = numpy.zeros(({len(bounded)}, c0.shape[0]), dtype=numpy.bool_)",
+             f"    for row in {'numba.prange' if parallel else 'range'}(c0.shape[0]):"]
+    for index, (has_min, has_max) in enumerate(bounded):
+        conditions = []
+        if has_min:
+            limits.append(f"min{index}")
+            conditions.append(f"c{index}[row] < min{index}")
+        if has_max:
+            limits.append(f"max{index}")
+            conditions.append(f"c{index}[row] > max{index}")
+        lines.append(f"        flags[{index}, row] = {' or '.join(conditions)}")
+    lines.insert(0, f"def out_of_bounds({', '.join(columns + limits)}):")
+    lines.append("    return flags")
+    namespace = {"numpy": numpy, "numba": numba}
+    exec("\n".join(lines), namespace)
+    compiled_check = numba.njit(nogil=True, parallel=parallel)(namespace["out_of_bounds"])
+    _COMPILED_CHECKS[(bounded, parallel)] = compiled_check
+    return compiled_check
+
+
+def _bound_values(bounds):
+    """
+    :param bounds: A tuple of (min, max) pairs, one for each column
+    :return: A tuple of the form (bounded, values) where bounded is the `bounded` argument of `_compile_bounds_check`
+             for `bounds` and values are the bounds that are set, to be passed in after the columns
+    """
+    bounded = tuple((min is not None, max is not None) for min, max in bounds)
+    return bounded, tuple(bound for pair in bounds for bound in pair if bound is not None)
+
+
+def _bounds(validator):
+    """
+    :return: The (min, max) bounds of `validator` when it's an `is_int` validator with bounds numba can compile in,
+             `None` otherwise. numba types ints as int64, ints beyond that range are left to numpy.
+    """
+    if _kind(validator) != "int" or (validator.min is None and validator.max is None):
+        return None
+    bounds = (validator.min, validator.max)
+    return bounds if all(type(bound) in (float, type(None)) or type(bound) is int and -2 ** 63 <= bound < 2 ** 63
+                         for bound in bounds) else None
+
+
+# noinspection PyShadowingBuiltins
+def compile(schema):
+    """
+    Compiles the bounds checks of all the `is_int` fields of `schema` into a single function with numba, so that all
+    of them are checked in one pass over the rows. Compiled checks are cached by which bounds of each field are set and
+    shared across schemas, whatever the values of those bounds.
+    :param schema: A schema, as described in `finicky.validate`. Fields which aren't `is_int` fields or have neither
+                   `min` nor `max` are left out.
+    :return: A function which takes in a mapping of field names to numpy int arrays holding the values of that field
+             for all rows, one for each field listed in its `fields` attribute, and returns a mapping of those field
+             names to the indices of the values that are out of bounds. `None` when numba isn't installed or `schema`
+             has no bounded `is_int` fields.
+    """
+    if numba is None:
+        return None
+    fields = [(key, validator) for key, validator in schema.items()
+              if _kind(validator) == "int" and (validator.min is not None or validator.max is not None)]
+    fields = [(key, _bounds(validator)) for key, validator in fields]
+    if not fields or any(bounds is None for _, bounds in fields):
+        return None
+    bounded, values = _bound_values(tuple(bounds for _, bounds in fields))
+    out_of_bounds = _compile_bounds_check(bounded)
+    keys = tuple(key for key, _ in fields)
+
+    def check(columns):
+        flags = out_of_bounds(*[columns[key] for key in keys], *values)
+        return {key: numpy.flatnonzero(flags[index]).tolist() for index, key in enumerate(keys)}
+
+    check.fields = keys
+    return check
+
+
+def compile_field(validator):
+    """
+    Compiles the bounds check of an `is_int` validator with numba into a function which checks a whole array of ints
+    with the rows split across threads, for arrays too large for a single pass over them to be quick.
+    ```
+        check_stars = jit.compile_field(is_int(min=0, max=5000))
+        out_of_bounds = check_stars(numpy.array([1, -1, 6000]))  # [1, 2]
+    ```
+    :param validator: An `is_int` validator with `min` or `max` set
+    :return: A function which takes in a numpy int array and returns the indices of the values that are out of bounds.
+             `None` when numba isn't installed or `validator` isn't a bounded `is_int` validator.
+    """
+    bounds = _bounds(validator) if numba is not None else None
+    if bounds is None:
+        return None
+    bounded, values = _bound_values((bounds,))
+    out_of_bounds = _compile_bounds_check(bounded, parallel=True)
+
+    def check(array):
+        return numpy.flatnonzero(out_of_bounds(array, *values)[0]).tolist()
+
+    return check
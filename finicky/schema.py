@@ -1,4 +1,15 @@
-from finicky.validators import ValidationException
+from finicky import jit
+from finicky.validators import ValidationException, _Invalid, _checker, _kind
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pandas is an optional dependency
+    pandas = None
 
 
 def validate(schema, data, hook=None):
@@ -28,21 +39,203 @@ def validate(schema, data, hook=None):
                  fields. it takes as an input, the newly validated data and must return the input on success
                  or raise a `finicky.validators.ValidationException` on failure. This hook may modify the input before
                  returning it.
-    :return: A tuple of the form (errors:str[], validated_data)
+    :return: A tuple of the form (errors, validated_data). errors maps each invalid field to its errors or is `None`
+             when validation succeeds. validated_data holds the value each validator returned, so the normalized values
+             (stripped strings, parsed numbers and dates etc.) are available without validating `data` a second time.
+             `data` itself is left untouched.
     """
-    errors = {}
+    # errors are only allocated once one is encountered, valid input being the common case
+    errors = None
     validated_data = {}
-    for key in schema:
-        try:
-            validated_data[key] = schema[key](data.get(key))
-        except ValidationException as e:
-            errors[key] = e.errors
-    if hook and not errors:
+    get = data.get
+    for key, validator in schema.items():
+        result = _checker(validator)(get(key))
+        if type(result) is _Invalid:
+            if errors is None:
+                errors = {}
+            errors[key] = result.errors
+        else:
+            validated_data[key] = result
+    if hook and errors is None:
         try:
             validated_data = hook(validated_data)
         except ValidationException as e:
-            errors["___hook"] = e.errors
+            errors = {"___hook": e.errors}
     return errors, validated_data
 
 
-__all__ = ("validate",)
+def _int_column(validator, values):
+    """
+    :return: `values` as a numpy array when they are the values of an `is_int` field that can be checked in bulk, that
+             is when numpy is installed and they are all ints that fit in an int64. `None` otherwise.
+    """
+    if numpy is None or _kind(validator) != "int" or set(map(type, values)) != {int}:
+        return None
+    column = numpy.array(values)
+    return column if column.dtype.kind == "i" else None
+
+
+def _frame_columns(schema, frame):
+    """
+    Splits a pandas DataFrame into the values of each field in `schema`, missing values (`NaN`, `None`, `NaT` etc.) and
+    the values of fields `frame` has no column for being `None`.
+    :return: A tuple of the form (columns, int_columns) where int_columns holds the numpy int columns of `is_int`
+             fields, which can be checked in bulk as they are
+    """
+    columns, int_columns = {}, {}
+    for key, validator in schema.items():
+        if key not in frame:
+            columns[key] = [None] * len(frame)
+            continue
+        series = frame[key]
+        if _kind(validator) == "int" and isinstance(series.dtype, numpy.dtype) and series.dtype.kind == "i":
+            int_columns[key] = series.to_numpy()
+            columns[key] = series.tolist()
+            continue
+        if _kind(validator) == "int" and _holds_ints_with_missing_values(series):
+            # pandas turns int columns with missing values into float columns, their values are turned back into ints
+            series = series.astype("Int64")
+        columns[key] = series.astype(object).where(series.notna(), None).tolist()
+    return columns, int_columns
+
+
+def _holds_ints_with_missing_values(series):
+    """
+    :return: Whether `series` is a float column with missing values whose other values are all whole numbers that fit
+             in an int64, which is how pandas stores a column of ints with missing values
+    """
+    if not isinstance(series.dtype, numpy.dtype) or series.dtype.kind != "f" or not series.hasnans:
+        return False
+    values = series.dropna()
+    return bool(((values % 1 == 0) & (values.abs() < 2 ** 63)).all())
+
+
+def _out_of_bounds(validator, column):
+    """
+    Checks a column of ints against the bounds of an `is_int` validator in a single vectorized comparison.
+    :return: The indices of the values that are out of bounds
+    """
+    flags = numpy.zeros(len(column), dtype=bool)
+    if validator.min is not None:
+        flags |= column < validator.min
+    if validator.max is not None:
+        flags |= column > validator.max
+    return numpy.flatnonzero(flags).tolist()
+
+
+# batches smaller than this are checked with numpy alone, compiling a check with numba taking longer than they do to check
+_JIT_MIN_ROWS = 10000
+
+
+def validate_batch(schema, rows, hook=None):
+    """
+    Validates each entry in `rows` against `schema`, giving the same results as calling `validate` on each of them.
+    Rows are validated a column at a time, which for `is_int` fields holding ints lets the bounds of the whole column be
+    checked in one go with numpy, when it's installed. With numba installed as well, the bounds of all such fields are
+    checked in a single compiled pass over the rows of batches of `_JIT_MIN_ROWS` rows or more (see `finicky.jit`).
+    :param schema: The schema against which each row should be validated, same as the schema described in `validate`.
+    :param rows: A list of the input data to be validated or a pandas DataFrame, whose columns are then validated as
+                 they are rather than being split into rows first. Missing values in a DataFrame are passed to the
+                 validators as `None`.
+    :param hook: An optional hook, same as the hook described in `validate`. It is invoked with each row which passes
+                 field validation.
+    :return: A tuple of the form (errors, validated_rows) where errors maps the index (position in a DataFrame) of each
+             invalid row to its errors or is `None` when all rows are valid.
+    """
+    if pandas is not None and isinstance(rows, pandas.DataFrame):
+        columns, int_columns = _frame_columns(schema, rows)
+    else:
+        columns = {key: [row.get(key) for row in rows] for key in schema}
+        int_columns = {}
+        for key, validator in schema.items():
+            column = _int_column(validator, columns[key])
+            if column is not None:
+                int_columns[key] = column
+    out_of_bounds = jit.compile(schema) if int_columns and len(rows) >= _JIT_MIN_ROWS else None
+    if out_of_bounds is not None and all(key in int_columns for key in out_of_bounds.fields):
+        invalid_entries = out_of_bounds(int_columns)
+    else:
+        invalid_entries = {}
+    for key in int_columns:
+        if key not in invalid_entries:
+            invalid_entries[key] = _out_of_bounds(schema[key], int_columns[key])
+
+    errors = {}
+    validated_rows = [{} for _ in range(len(rows))]
+    for key, validator in schema.items():
+        check = _checker(validator)
+        values = columns[key]
+        if key in int_columns:
+            # entries within bounds are left as they are by `is_int`
+            for validated_row, value in zip(validated_rows, values):
+                validated_row[key] = value
+        for index in invalid_entries.get(key, range(len(values))):
+            result = check(values[index])
+            if type(result) is _Invalid:
+                validated_rows[index].pop(key, None)
+                errors.setdefault(index, {})[key] = result.errors
+            else:
+                validated_rows[index][key] = result
+    if hook:
+        for index, validated_row in enumerate(validated_rows):
+            if index not in errors:
+                try:
+                    validated_rows[index] = hook(validated_row)
+                except ValidationException as e:
+                    errors[index] = {"___hook": e.errors}
+    return errors or None, validated_rows
+
+
+_COMPILED_SCHEMAS = {}
+_MAX_COMPILED_SCHEMAS = 256
+
+
+def compile_schema(schema):
+    """
+    Compiles `schema` into a function that validates its input exactly like `validate` does but with the loop over the
+    schema's fields unrolled into straight-line code, sparing each field the loop and dictionary lookups. It's meant
+    for schemas that are defined once and used to validate a lot of input, web request bodies for instance.
+
+    Compiled functions are cached per schema object, changes made to a schema after it has been compiled are not
+    picked up by its compiled function.
+    ```
+        validate_repo = compile_schema(repo_schema)
+        errors, validated_repo = validate_repo(repo, hook=None)
+    ```
+    :param schema: The schema against which input should be validated, same as the schema described in `validate`.
+    :return: A function that takes in the input data and an optional hook, with the same meaning as in `validate`, and
+             returns a tuple of the form (errors, validated_data)
+    """
+    cached = _COMPILED_SCHEMAS.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    namespace = {"ValidationException": ValidationException, "_Invalid": _Invalid}
+    lines = ["def validate_compiled(data, hook=None):",
+             "    errors = None",
+             "    validated_data = {}",
+             "    get = data.get"]
+    for index, key in enumerate(schema):
+        namespace["_k{}".format(index)] = key
+        namespace["_v{}".format(index)] = _checker(schema[key])
+        lines += ["    result = _v{0}(get(_k{0}))".format(index),
+                  "    if type(result) is _Invalid:",
+                  "        if errors is None:",
+                  "            errors = {}",
+                  "        errors[_k{0}] = result.errors".format(index),
+                  "    else:",
+                  "        validated_data[_k{0}] = result".format(index)]
+    lines += ["    if hook and errors is None:",
+              "        try:",
+              "            validated_data = hook(validated_data)",
+              "        except ValidationException as e:",
+              "            errors = {'___hook': e.errors}",
+              "    return errors, validated_data"]
+    exec(compile("\n".join(lines), "<finicky schema>", "exec"), namespace)
+    if len(_COMPILED_SCHEMAS) >= _MAX_COMPILED_SCHEMAS:
+        _COMPILED_SCHEMAS.clear()
+    # the schema is kept alongside its compiled function so its id can't be reused while cached
+    _COMPILED_SCHEMAS[id(schema)] = (schema, namespace["validate_compiled"])
+    return namespace["validate_compiled"]
+
+
+__all__ = ("validate", "compile_schema", "validate_batch")
@@ -1,17 +1,243 @@
 from datetime import datetime
+from types import FunctionType
 import re
+import warnings
+import weakref
+
+try:
+    import re2
+except ImportError:  # google-re2 is an optional dependency
+    re2 = None
+
+# ISO 8601 formats `datetime.fromisoformat` can parse, mapped to the length of a fully padded input and the character
+# separating the date from the time (`None` for date only formats). Inputs 26 characters long carry microseconds.
+_ISO_FORMATS = {"%Y-%m-%d": (10, None), "%Y-%m-%dT%H:%M:%S": (19, "T"), "%Y-%m-%d %H:%M:%S": (19, " "),
+                "%Y-%m-%dT%H:%M:%S.%f": (26, "T")}
+
+# the regular expressions strptime matches date directives with (see `_strptime.TimeRE`)
+_DATE_DIRECTIVES = {
+    "Y": r"(?P<Y>\d\d\d\d)", "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])", "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)", "M": r"(?P<M>[0-5]\d|\d)", "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "y": r"(?P<y>\d\d)", "f": r"(?P<f>[0-9]{1,6})",
+}
+# the number of characters each directive takes up in zero padded input
+_DATE_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2, "y": 2, "f": 6}
+# the datetime fields in constructor order paired with the value strptime uses when the format leaves them out
+_DATE_FIELDS = (("Y", 1900), ("m", 1), ("d", 1), ("H", 0), ("M", 0), ("S", 0), ("f", 0))
+
+# strings `int(value, 10)` and `float(value)` accept once stripped of whitespace
+_INT_RE = re.compile(r"[+-]?\d(?:_?\d)*")
+_FLOAT_RE = re.compile(r"[+-]?(?:(?:\d(?:_?\d)*)?\.\d(?:_?\d)*|\d(?:_?\d)*\.?)(?:[eE][+-]?\d(?:_?\d)*)?"
+                       r"|[+-]?(?:inf(?:inity)?|nan)", re.IGNORECASE)
+
+# compiled `is_str` patterns shared by all validators using the same pattern, cleared once it holds
+# `_MAX_CACHED_PATTERNS` patterns so patterns built on the fly can't grow it without bound
+_PATTERN_CACHE = {}
+_MAX_CACHED_PATTERNS = 256
+# date parsers shared by all `is_date` validators using the same format, cleared once it holds `_MAX_DATE_PARSERS`
+# parsers like `_PATTERN_CACHE`
+_DATE_PARSERS = {}
+_MAX_DATE_PARSERS = 256
+
+# the `check` function behind each built-in validator, looked up by the validator itself. Wrappers such as those made
+# with `functools.wraps` copy a validator's attributes but not its identity, so they are never mistaken for it
+_BUILTIN_CHECKS = weakref.WeakKeyDictionary()
 
 
 class ValidationException(Exception):
+    # errors are kept in a slot rather than the instance dict, which is then never allocated
+    __slots__ = ("__errors",)
+
     def __init__(self, errors=None):
         self.__errors = errors
-        super(ValidationException, self).__init__(errors if type(errors) is str else str(errors))
+        super(ValidationException, self).__init__(errors)
 
     @property
     def errors(self):
         return self.__errors
 
 
+class _Invalid(object):
+    """
+    Returned instead of the validated input by the `check` function behind a built-in validator when the input is
+    invalid. Returning it spares `validate` the cost of raising and catching a `ValidationException` per error.
+    Error messages are built lazily, from a template and the values it's formatted with, sparing invalid input which
+    is discarded without its errors being looked at the cost of formatting them.
+    """
+    __slots__ = ("_errors", "_args")
+
+    def __init__(self, errors, *args):
+        self._errors = errors
+        self._args = args
+
+    @property
+    def errors(self):
+        if self._args:
+            self._errors, self._args = self._errors.format(*self._args), ()
+        return self._errors
+
+
+def _raising(check):
+    """
+    Turns a `check` function, which returns an `_Invalid` for invalid input, into a validator which raises a
+    `ValidationException` instead. `check` is registered in `_BUILTIN_CHECKS` for `validate` to call.
+    """
+
+    def func(value, _type=type, _Invalid=_Invalid, _VE=ValidationException):
+        result = check(value)
+        if _type(result) is _Invalid:
+            raise _VE(result.errors)
+        return result
+
+    _BUILTIN_CHECKS[func] = check
+    return func
+
+
+def _builtin_check(validator):
+    """
+    :return: The `check` function behind `validator` when it's a built-in validator, `None` otherwise
+    """
+    try:
+        return _BUILTIN_CHECKS.get(validator)
+    except TypeError:  # unhashable and non weak referenceable callables can't be built-in validators
+        return None
+
+
+def _kind(validator):
+    """
+    :return: The `kind` of `validator` when it's a built-in validator, `None` otherwise. Wrappers of a built-in
+             validator copy its `kind` along with its other attributes but may validate input any way they like.
+    """
+    return validator.kind if _builtin_check(validator) is not None else None
+
+
+def _checker(validator):
+    """
+    Returns the `check` function behind `validator` when it's a built-in validator, otherwise wraps `validator` into a
+    function which returns an `_Invalid` instead of raising a `ValidationException`.
+    """
+    check = _builtin_check(validator)
+    if check is not None:
+        return check
+
+    def check(value, _validator=validator, _VE=ValidationException, _Invalid=_Invalid):
+        try:
+            return _validator(value)
+        except _VE as e:
+            return _Invalid(e.errors)
+
+    return check
+
+
+# the steps making up the `check` functions generated by `_specialize`, which validate and convert `value`.
+# Ints (floats) are used as is and strings parsed directly, sparing them a round trip through `str`. Strings are checked
+# up front as raising and catching a ValueError for each invalid one is comparatively expensive. Plain ASCII digits,
+# with a decimal point for floats, are the common case and are told apart with str methods, the regular expression
+# being left for signs, whitespace, underscores, exponents and so on
+_INT_CONVERSION = """
+    if _type(value) is not _int:
+        try:
+            if _isinstance(value, _str):
+                if not (value.isascii() and value.isdigit()) and _int_match(value.strip()) is None:
+                    return _Invalid("'{}' is not a valid integer", value)
+                value = _int(value, 10)
+            elif _isinstance(value, (_float, _bool)):
+                raise ValueError()
+            else:
+                value = _int(_str(value))
+        except ValueError:
+            return _Invalid("'{}' is not a valid integer", value)"""
+# rounding to an int (`_round_to` being `None`) raises for NaN and infinities, which are then invalid
+_FLOAT_CONVERSION = """
+    try:
+        if _type(value) is not _float:
+            if _isinstance(value, _str):
+                if not (value.isascii() and value.replace(".", "", 1).isdigit()) and \
+                        _float_match(value.strip()) is None:
+                    return _Invalid("'{}' is not a valid floating number", value)
+                value = _float(value)
+            else:
+                value = _float(_str(value))
+        value = _round(value, _round_to)
+    except (ValueError, OverflowError):
+        return _Invalid("'{}' is not a valid floating number", value)"""
+# ints which convert to floats exactly have no decimal places to round, used when rounding to whole numbers or finer
+_INT_OR_FLOAT_CONVERSION = """
+    if _type(value) is _int and -9007199254740992 <= value <= 9007199254740992:
+        value = _float(value)
+    else:""" + _FLOAT_CONVERSION.replace("\n", "\n    ")
+_MIN_CHECK = """
+    if value < _min:
+        return _Invalid("'{}' is less than minimum allowed ({})", value, _min)"""
+_MAX_CHECK = """
+    if value > _max:
+        return _Invalid("'{}' is greater than maximum allowed ({})", value, _max)"""
+# strings way longer than `_max_len` are rejected before being stripped, which copies them, and only their start is
+# quoted in the error message
+_RAW_MAX_LEN_CHECK = """
+    if _type(value) is _str and _len(value) > _max_len + 1024:
+        return _Invalid("'{}...' is longer than maximum required length({})", value[:_max_len], _max_len)"""
+# strings are stripped directly, sparing them a pass through `str`. strip returns strings without surrounding whitespace
+# as they are, which beats inspecting their first and last characters up front
+_STR_CONVERSION = """
+    value = value.strip() if _type(value) is _str else _str(value).strip()"""
+_MIN_LEN_CHECK = """
+    if _len(value) < _min_len:
+        return _Invalid("'{}' is shorter than minimum required length({})", value, _min_len)"""
+_MAX_LEN_CHECK = """
+    if _len(value) > _max_len:
+        return _Invalid("'{}' is longer than maximum required length({})", value, _max_len)"""
+_PATTERN_CHECK = """
+    if _match(value) is None:
+        return _Invalid("'{}' does not match expected pattern({})", value, _pattern)"""
+_DATE_CONVERSION = """
+    if not _isinstance(value, _datetime):
+        try:
+            value = _parse(value.strip() if _type(value) is _str else _str(value).strip())
+        except ValueError:
+            return _Invalid("'{}' does not match expected format({})", value, _format)"""
+_MIN_DATE_CHECK = """
+    if value < _min:
+        return _Invalid("'{}' occurs before minimum date({})", value.strftime(_format), _min_str)"""
+_MAX_DATE_CHECK = """
+    if value > _max:
+        return _Invalid("'{}' occurs after maximum date({})", value.strftime(_format), _max_str)"""
+
+# the `check` functions generated by `_specialize`, keyed by the configuration they were generated for
+_SPECIALIZED_CHECKS = {}
+
+
+def _specialize(bindings, required, *steps):
+    """
+    Generates the `check` function of a validator made up of only the steps its configuration needs, sparing each call
+    the checks for criteria which were not set. A function is generated once per configuration and copied for each
+    validator with its own criteria bound as defaults, like the builtins it uses.
+    :param bindings: The names the steps use mapped to their values, `_default` and `_Invalid` included
+    :param required: Whether missing values are invalid, missing values being replaced with `_default` when it's set
+    :param steps: The source of the steps validating `value`, `_INT_CONVERSION` for instance. Falsy steps are left out
+                  which makes it convenient to pass steps conditionally, `min is not None and _MIN_CHECK` for instance
+    :return: The generated check function
+    """
+    steps = tuple(filter(None, steps))
+    key = (tuple(bindings), steps, required, bindings["_default"] is not None)
+    check = _SPECIALIZED_CHECKS.get(key)
+    if check is None:
+        lines = ["def check(value, {}):".format(", ".join("{0}={0}".format(name) for name in bindings)),
+                 "    if value is None:"]
+        if bindings["_default"] is not None:
+            lines.append("        value = _default")
+        elif required:
+            lines.append("        return _Invalid('required but was missing')")
+        else:
+            lines.append("        return None")
+        lines += steps
+        lines.append("    return value")
+        namespace = dict(bindings)
+        exec(compile("\n".join(lines), "<finicky validator>", "exec"), namespace)
+        check = _SPECIALIZED_CHECKS[key] = namespace["check"]
+    return FunctionType(check.__code__, check.__globals__, None, tuple(bindings.values()))
+
+
 # noinspection PyShadowingBuiltins
 def is_int(required=False, default=None, min=None, max=None):
     """
@@ -26,24 +252,15 @@ def is_int(required=False, default=None, min=None, max=None):
     :raises ArgumentError: when `required` is `True` and default is provided
     """
 
-    def func(value):
-        value = value if value is not None else default
-        if required and value is None:
-            raise ValidationException("required but was missing")
-        if not required and value is None:
-            return None
-        try:
-            if isinstance(value, float):
-                raise ValueError()
-            value = int(str(value))
-            if min is not None and value < min:
-                raise ValidationException("'{}' is less than minimum allowed ({})".format(value, min))
-            if max is not None and value > max:
-                raise ValidationException("'{}' is greater than maximum allowed ({})".format(value, max))
-            return value
-        except ValueError:
-            raise ValidationException("'{}' is not a valid integer".format(value))
+    # builtins and factory arguments are bound as defaults so the validator looks them up as locals
+    check = _specialize({
+        "_int": int, "_str": str, "_float": float, "_bool": bool, "_type": type, "_isinstance": isinstance,
+        "_int_match": _INT_RE.fullmatch, "_Invalid": _Invalid, "_min": min, "_max": max, "_default": default,
+    }, required, _INT_CONVERSION, min is not None and _MIN_CHECK, max is not None and _MAX_CHECK)
 
+    func = _raising(check)
+    # criteria the validator checks, for batch validation to introspect
+    func.kind, func.required, func.default, func.min, func.max = "int", required, default, min, max
     return func
 
 
@@ -61,26 +278,44 @@ def is_float(required=False, default=None, min=None, max=None, round_to=2):
                 an a validation exception otherwise. It returns the newly validated input on success.
     """
 
-    def func(value):
-        value = value if value is not None else default
-        if required and value is None:
-            raise ValidationException("required but was missing")
-        if not required and value is None:
-            return None
-        try:
-            value = round(float(str(value)), round_to)
-            if min is not None and value < min:
-                raise ValidationException("'{}' is less than minimum allowed ({})".format(value, min))
-            if max is not None and value > max:
-                raise ValidationException("'{}' is greater than maximum allowed ({})".format(value, max))
-            return value
-        except ValueError:
-            raise ValidationException("'{}' is not a valid floating number".format(value))
+    conversion = _INT_OR_FLOAT_CONVERSION if type(round_to) is int and round_to >= 0 else _FLOAT_CONVERSION
+    check = _specialize({
+        "_float": float, "_int": int, "_str": str, "_round": round, "_type": type, "_isinstance": isinstance,
+        "_float_match": _FLOAT_RE.fullmatch, "_Invalid": _Invalid, "_min": min, "_max": max, "_default": default,
+        "_round_to": round_to,
+    }, required, conversion, min is not None and _MIN_CHECK, max is not None and _MAX_CHECK)
 
+    func = _raising(check)
+    func.kind, func.required, func.default, func.min, func.max = "float", required, default, min, max
+    func.round_to = round_to
     return func
 
 
-def is_str(required=False, default=None, min_len=None, max_len=None, pattern=None):
+def _compile_pattern(pattern, flags=0):
+    """
+    Compiles `pattern` or returns the compiled pattern from an earlier call with the same `pattern` and `flags`.
+    Patterns are compiled with RE2, which matches in linear time, when google-re2 is installed and `flags` isn't set.
+    Patterns RE2 doesn't support (backreferences, lookarounds, `\\Z` etc.) are compiled with `re`, with a warning as
+    they are then exposed to regular expression denial of service.
+    """
+    compiled_pattern = _PATTERN_CACHE.get((pattern, flags))
+    if compiled_pattern is None:
+        if re2 is not None and not flags:
+            try:
+                compiled_pattern = re2.compile(pattern)
+            except re2.error:
+                warnings.warn(f"RE2 cannot compile pattern({pattern}), it is matched with the backtracking `re` "
+                              f"instead", RuntimeWarning)
+                compiled_pattern = re.compile(pattern, flags)
+        else:
+            compiled_pattern = re.compile(pattern, flags)
+        if len(_PATTERN_CACHE) >= _MAX_CACHED_PATTERNS:
+            _PATTERN_CACHE.clear()
+        _PATTERN_CACHE[(pattern, flags)] = compiled_pattern
+    return compiled_pattern
+
+
+def is_str(required=False, default=None, min_len=None, max_len=None, pattern=None, flags=0, search=False):
     """
        Returns a function that when invoked with a given input asserts that the input is a valid string
        and that it meets the specified criteria. All text are automatically striped off of both trailing and leading
@@ -88,35 +323,175 @@ def is_str(required=False, default=None, min_len=None, max_len=None, pattern=Non
        :param required: False by default.
        :param default: default value to be used when value is `None` (or missing).
        :param min_len: the minimum length allowed. Setting this to 1 effectively rejects empty strings
-       :param max_len: the maximum length allowed. Strings longer than this will be rejected
-       :param pattern: a valid python regex pattern. Define your patterns carefully with regular expression
-                        attacks in mind.
+       :param max_len: the maximum length allowed. Strings longer than this will be rejected, those with more than
+                       1024 characters over it without even being stripped.
+       :param pattern: a valid python regex pattern which the whole input must match. Define your patterns carefully
+                        with regular expression attacks in mind, avoid nested quantifiers like `(a+)+` and
+                        overlapping alternations like `(a|a)*` as they backtrack exponentially on crafted input.
+       :param flags: flags the pattern is compiled with. `re.ASCII` is faster on short inputs when matching non-ascii
+                     text isn't needed.
+       :param search: when `True` the pattern only needs to match somewhere in the input rather than the whole of it.
        :return: A callable that when invoked with an input will check that it meets the criteria defined above or raise
                 an a validation exception otherwise. It returns the newly validated input on success.
     """
-    if pattern:
-        # compile pattern once and reuse for all validations
-        compiled_pattern = re.compile(pattern)
-
-    # noinspection PyShadowingBuiltins
-    def func(input):
-        input = input or default
-        if required and input is None:
-            raise ValidationException('required but was missing')
-        if not required and input is None:
-            return default
-        input = str(input).strip()
-        if min_len is not None and len(input) < min_len:
-            raise ValidationException("'{}' is shorter than minimum required length({})".format(input, min_len))
-        if max_len is not None and len(input) > max_len:
-            raise ValidationException("'{}' is longer than maximum required length({})".format(input, max_len))
-        if pattern and compiled_pattern.match(input) is None:
-            raise ValidationException("'{}' does not match expected pattern({})".format(input, pattern))
-        return input
-
+    # compile pattern once and reuse for all validations
+    compiled_pattern = _compile_pattern(pattern, flags) if pattern else None
+    match = None if compiled_pattern is None else compiled_pattern.search if search else compiled_pattern.fullmatch
+    check = _specialize({
+        "_str": str, "_type": type, "_len": len, "_Invalid": _Invalid, "_match": match, "_pattern": pattern,
+        "_min_len": min_len, "_max_len": max_len, "_default": default,
+    }, required, max_len is not None and _RAW_MAX_LEN_CHECK, _STR_CONVERSION, min_len is not None and _MIN_LEN_CHECK,
+        max_len is not None and _MAX_LEN_CHECK, match is not None and _PATTERN_CHECK)
+
+    func = _raising(check)
+    func.kind, func.required, func.default, func.min_len, func.max_len = "str", required, default, min_len, max_len
+    func.pattern, func.flags, func.search = pattern, flags, search
     return func
 
 
+# noinspection PyShadowingBuiltins
+def _compile_date_format(format):
+    """
+    Compiles `format` into a regular expression the same way strptime does.
+    :param format: The date format
+    :return: The compiled pattern or `None` when `format` uses directives not defined in `_DATE_DIRECTIVES`
+    """
+    pattern = ""
+    directives = set()
+    for index, token in enumerate(re.split(r"(%.)", format)):
+        if index % 2 == 0:
+            if "%" in token:
+                return None
+            pattern += r"\s+".join(re.escape(chunk) for chunk in re.split(r"\s+", token))
+        elif token == "%%":
+            pattern += "%"
+        elif token[1] in _DATE_DIRECTIVES and token[1] not in directives:
+            directives.add(token[1])
+            pattern += _DATE_DIRECTIVES[token[1]]
+        else:
+            return None
+    if {"Y", "y"} <= directives:
+        # which of the two years strptime picks depends on their order, that's left to strptime
+        return None
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# noinspection PyShadowingBuiltins
+def _compile_padded_date_format(format):
+    """
+    Compiles `format`, which must be made up of the directives in `_DATE_WIDTHS`, into a function that parses zero
+    padded input (2020-01-05 rather than 2020-1-5 for %Y-%m-%d) by slicing its fields at fixed offsets. Such input is
+    parsed exactly like strptime would and the function returns `None` for any other input, which it leaves to the
+    compiled regular expression.
+    :param format: The date format
+    :return: The parsing function
+    """
+    offset, conditions, fields = 0, [], {}
+    for index, token in enumerate(re.split(r"(%.)", format)):
+        literal = token if index % 2 == 0 else "%" if token == "%%" else None
+        if literal is None:
+            end = offset + _DATE_WIDTHS[token[1]]
+            fields[token[1]] = "text[{}:{}]".format(offset, end)
+            conditions.append("{}.isdigit()".format(fields[token[1]]))
+        else:
+            end = offset + len(literal)
+            if literal:
+                conditions.append("text[{}:{}] == {!r}".format(offset, end, literal))
+        offset = end
+    if "y" in fields:
+        # two digit years are mapped the way strptime does, following the POSIX convention
+        fields["Y"] = "_int({0}) + (2000 if {0} <= '68' else 1900)".format(fields["y"])
+    arguments = ", ".join("_int({})".format(fields[name]) if name in fields else repr(default)
+                          for name, default in _DATE_FIELDS)
+    # input with non-ascii digits is left to the regular expression, `%f` only matching ascii ones
+    conditions[:0] = ["_len(text) == {}".format(offset), "text.isascii()"]
+    namespace = {"_datetime": datetime, "_int": int, "_len": len}
+    exec(compile("\n".join([
+        "def parse(text, _datetime=_datetime, _int=_int, _len=_len):",
+        "    if {}:".format(" and ".join(conditions)),
+        "        try:",
+        "            return _datetime({})".format(arguments),
+        "        except ValueError:",
+        "            pass",
+        "    return None"]), "<finicky date format>", "exec"), namespace)
+    return namespace["parse"]
+
+
+# noinspection PyShadowingBuiltins
+def _date_parser(format):
+    """
+    Returns the parser `_build_date_parser` builds for `format`, built on the first call with that format and shared by
+    all the validators using it afterwards.
+    """
+    parser = _DATE_PARSERS.get(format)
+    if parser is None:
+        parser = _build_date_parser(format)
+        if len(_DATE_PARSERS) >= _MAX_DATE_PARSERS:
+            _DATE_PARSERS.clear()
+        _DATE_PARSERS[format] = parser
+    return parser
+
+
+# noinspection PyShadowingBuiltins
+def _build_date_parser(format):
+    """
+    Returns a function that parses a date string formatted as `format` into a datetime object, raising a `ValueError`
+    when the string does not match. It behaves exactly like `datetime.strptime` but formats made up of numeric
+    directives only are compiled once up front and ISO 8601 formats take the much cheaper `datetime.fromisoformat`
+    route.
+    :param format: The date format
+    :return: A callable that takes in a date string and returns a datetime object
+    """
+
+    compiled_format = _compile_date_format(format)
+    if compiled_format is None:
+        try:
+            # prime strptime's cache of compiled formats ahead of the first validation
+            datetime.strptime("", format)
+        except ValueError:
+            pass
+
+        def strptime(text, _strptime=datetime.strptime, _format=format):
+            return _strptime(text, _format)
+    else:
+        has_short_year, has_fraction = "y" in compiled_format.groupindex, "f" in compiled_format.groupindex
+        parse_padded = _compile_padded_date_format(format)
+
+        def strptime(text, _match=compiled_format.match, _len=len, _int=int, _datetime=datetime, _fields=_DATE_FIELDS,
+                     _parse_padded=parse_padded):
+            date = _parse_padded(text)
+            if date is not None:
+                return date
+            match = _match(text)
+            if match is None or match.end() != _len(text):
+                raise ValueError(f"'{text}' does not match format '{format}'")
+            fields = match.groupdict()
+            if has_short_year:
+                # two digit years are mapped the way strptime does, following the POSIX convention
+                year = _int(fields["y"])
+                fields["Y"] = year + 2000 if year <= 68 else year + 1900
+            if has_fraction:
+                fields["f"] = fields["f"] + "0" * (6 - _len(fields["f"]))
+            return _datetime(*[_int(fields[name]) if name in fields else default for name, default in _fields])
+
+    if format not in _ISO_FORMATS:
+        return strptime
+    length, separator = _ISO_FORMATS[format]
+
+    def parse(text, _len=len, _fromisoformat=datetime.fromisoformat, _strptime=strptime):
+        # fromisoformat is more lenient than strptime so only hand it input in the fully padded form of `format`
+        if _len(text) == length and text[4] == text[7] == "-" and (separator is None or (
+                text[10] == separator and text[13] == text[16] == ":" and text[11:13] != "24" and (
+                length != 26 or text[19] == "." and text[20:].isdigit()))):
+            try:
+                return _fromisoformat(text)
+            except ValueError:
+                pass
+        return _strptime(text)
+
+    return parse
+
+
 # noinspection PyShadowingBuiltins
 def is_date(required=False, default=None, format="%Y-%m-%d", min=None,
             max=None):
@@ -137,26 +512,21 @@ def is_date(required=False, default=None, format="%Y-%m-%d", min=None,
                 a validation exception otherwise. It returns the newly validated input on success or the default value
                 provided
     """
-
-    def func(input_date):
-        if required and input_date is None:
-            raise ValidationException("required but was missing")
-        input_date = input_date or default
-        if not required and not input_date:
-            return None
-        if not isinstance(input_date, datetime):
-            try:
-                input_date = datetime.strptime(str(input_date).strip(), format)
-            except ValueError as e:
-                raise ValidationException("'{}' does not match expected format({})".format(input_date, format))
-        if min and input_date < min:
-            raise ValidationException(
-                "'{}' occurs before minimum date({})".format(input_date.strftime(format), min.strftime(format)))
-        if max and input_date > max:
-            raise ValidationException(
-                "'{}' occurs after maximum date({})".format(input_date.strftime(format), max.strftime(format)))
-        return input_date
-
+    parse = _date_parser(format)
+    # the bounds are formatted once here rather than each time an input falls out of them
+    min_str = min.strftime(format) if isinstance(min, datetime) else str(min)
+    max_str = max.strftime(format) if isinstance(max, datetime) else str(max)
+
+    # the default only stands in for missing input of optional fields, required fields reject missing input regardless
+    check = _specialize({
+        "_datetime": datetime, "_str": str, "_type": type, "_isinstance": isinstance, "_parse": parse,
+        "_Invalid": _Invalid, "_format": format, "_min": min, "_max": max, "_min_str": min_str, "_max_str": max_str,
+        "_default": None if required else default,
+    }, required, _DATE_CONVERSION, min is not None and _MIN_DATE_CHECK, max is not None and _MAX_DATE_CHECK)
+
+    func = _raising(check)
+    func.kind, func.required, func.default, func.min, func.max = "date", required, default, min, max
+    func.format = format
     return func
 
 
@@ -172,63 +542,90 @@ def is_dict(schema, required=True, default=None):
     :raises ArgumentError: When both required and default is set
     """
 
-    def func(_input):
-        errors = {}
-        _input = _input or default
-        if required and _input is None:
-            raise ValidationException("required but was missing")
-        if type(_input) != dict:
-            raise ValidationException("expected a dictionary but got {}".format(type(_input)))
-        keys = schema.keys()
-        for key in keys:
-            try:
-                _input[key] = schema[key](_input.get(key))
-            except ValidationException as e:
-                errors[key] = e.errors
-        if errors:
-            raise ValidationException(errors)
-        return _input
-
+    # the fields are validated through their `check` functions, nested errors being returned rather than raised
+    def check(value, _type=type, _dict=dict, _Invalid=_Invalid,
+              _items=[(key, _checker(validator)) for key, validator in schema.items()], _default=default,
+              _required=required):
+        if value is None:
+            value = _default
+            if _required and value is None:
+                return _Invalid("required but was missing")
+        if _type(value) != _dict:
+            return _Invalid("expected a dictionary but got {}", _type(value))
+        # errors are only allocated once one is encountered, valid input being the common case
+        errors = None
+        get = value.get
+        for key, check_field in _items:
+            result = check_field(get(key))
+            if _type(result) is _Invalid:
+                if errors is None:
+                    errors = {}
+                errors[key] = result.errors
+            else:
+                value[key] = result
+        if errors is not None:
+            return _Invalid(errors)
+        return value
+
+    func = _raising(check)
+    func.kind, func.required, func.default = "dict", required, default
     return func
 
 
-def is_list(validator, required=True, default=(), min_len=0, max_len=None, all=True):
+def is_list(validator, required=True, default=None, min_len=0, max_len=None, all=True):
     """
     A validator factory that returns a function for validating lists. By default, all entries must pass the validation
     else the field would be considered invalid. This can be overridden by setting `all` to `false` (see below).
 
     :param validator: A validator for validating each entry in the list.
     :param required: `True` when the field is required, `False` otherwise. `True` by default
-    :param default:  The default value. Only allowed for non-required fields.
+    :param default:  The default value. Only allowed for non-required fields. When it's not provided, missing input
+                     validates to a new empty list for non-required fields.
     :param min_len: The minimum number of entries allowed, defaults to 0
     :param max_len: The maximum number of entries, defaults to `None`
     :param all: When `True`, all fields must pass validation for this list to be considered valid. When `False` at
-                least one entry must pass validation for this list to be considered valid. Only entries that pass
-                validation shall be returned.
+                least one entry must pass validation for a non empty list to be considered valid, empty lists having no
+                invalid entries being valid as they are. Only entries that pass validation shall be returned.
     :return: A function that when invoked with a list shall validate it against the criteria specified above
 
     :raises ArgumentError: When both required and default is set
     """
 
-    def func(_input):
-        _input = _input or default
-        if required and not _input:
-            raise ValidationException("required but was missing")
-
-        if type(_input) is not list:
-            raise ValidationException("expected a list but got {}".format(type(_input)))
-
-        errors = []
-        validated_input = []
-        for index, entry in enumerate(_input, 0):
-            try:
-                validated_input.append(validator(entry))
-            except ValidationException as e:
-                errors.append(e.errors)
-        if (all and errors) or (not all and len(errors) == len(_input)):
-            raise ValidationException(errors)
+    def check(value, _type=type, _list=list, _len=len, _Invalid=_Invalid, _check_entry=_checker(validator),
+              _default=None if default is None else list(default), _required=required, _all=all):
+        if value is None:
+            if _default is None:
+                if _required:
+                    return _Invalid("required but was missing")
+                return []
+            value = _default
+
+        if _type(value) is not _list:
+            return _Invalid("expected a list but got {}", _type(value))
+
+        # invalid entries are kept as they are, their error messages are only built if this list turns out invalid
+        invalid_entries = None
+        # validated entries are written into a list sized up front instead of growing one entry at a time
+        entry_count = _len(value)
+        validated_input = [None] * entry_count
+        validated_count = 0
+        for entry in value:
+            result = _check_entry(entry)
+            if _type(result) is _Invalid:
+                if invalid_entries is None:
+                    invalid_entries = []
+                invalid_entries.append(result)
+            else:
+                validated_input[validated_count] = result
+                validated_count += 1
+        del validated_input[validated_count:]
+        error_count = entry_count - validated_count
+        if error_count and (_all or error_count == entry_count):
+            return _Invalid([result.errors for result in invalid_entries])
         return validated_input
 
+    func = _raising(check)
+    func.kind, func.required, func.default, func.all = "list", required, default, all
     return func
 
 
@@ -1,12 +1,23 @@
+import os
+
 import pathlib2
 from setuptools import setup
 
 HERE = pathlib2.Path(__file__).parent
 
 README = (HERE / "Readme.md").read_text()
-deps = pathlib2.Path('requirements.txt').read_bytes().split("\n")
+deps = pathlib2.Path('requirements.txt').read_text().splitlines()
 dependencies = [dep for dep in deps if len(dep.strip()) > 0]
 
+ext_modules = []
+if os.environ.get("FINICKY_CYTHON"):
+    # compiles the modules into C extensions which take precedence over the .py files once installed, requires cython.
+    # infer_types lets the counters and lengths of the validation loops be typed as C integers
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(["finicky/validators.py", "finicky/schema.py"],
+                            compiler_directives={"language_level": "3", "infer_types": True})
+
 setup(
     name="Finicky",
     version="0.1.7",
@@ -22,10 +33,17 @@ setup(
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.7",
     ],
-    python_requires=">=2.7",  # requires f-strings
+    python_requires=">=3.7",  # requires datetime.fromisoformat
     packages=["finicky"],
     include_package_data=True,
     install_requires=dependencies,
+    ext_modules=ext_modules,
+    extras_require={
+        "re2": ["google-re2"],
+        "numpy": ["numpy"],
+        "numba": ["numpy", "numba"],
+        "pandas": ["numpy", "pandas"],
+    },
     entry_points={
         "console_scripts": [
         ]
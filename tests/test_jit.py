@@ -0,0 +1,58 @@
+import functools
+import pytest
+
+from finicky import is_int, is_float, is_str
+from finicky import jit
+
+numpy = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+
+class TestCompile:
+    def test_must_not_compile_schemas_without_bounded_int_fields(self):
+        assert jit.compile({"name": is_str(), "price": is_float(min=0), "stars": is_int()}) is None
+
+    def test_must_only_check_bounded_int_fields(self):
+        check = jit.compile({"name": is_str(), "stars": is_int(min=0), "forks": is_int(max=10), "id": is_int()})
+        assert check.fields == ("stars", "forks")
+
+    def test_must_not_compile_bounds_beyond_the_int64_range(self):
+        assert jit.compile({"stars": is_int(max=2 ** 64)}) is None
+        assert jit.compile_field(is_int(min=-2 ** 63 - 1)) is None
+
+    def test_must_leave_wrapped_int_validators_out(self):
+        stars_validator = is_int(min=0)
+
+        @functools.wraps(stars_validator)
+        def negated_stars(value):
+            return -stars_validator(value)
+
+        assert jit.compile({"stars": negated_stars}) is None
+
+    def test_must_return_indices_of_entries_out_of_bounds(self):
+        check = jit.compile({"stars": is_int(min=0, max=5000), "forks": is_int(max=10)})
+        columns = {"stars": numpy.array([-1, 0, 5000, 5001]), "forks": numpy.array([11, 10, -3, 12])}
+        assert check(columns) == {"stars": [0, 3], "forks": [0, 3]}
+
+    def test_must_share_compiled_checks_between_fields_with_the_same_bounds_set(self, monkeypatch):
+        monkeypatch.setattr(jit, "_COMPILED_CHECKS", {})
+        check = jit.compile({"stars": is_int(min=0, max=5000)})
+        other_check = jit.compile({"stars": is_int(min=10, max=20)})
+        assert list(jit._COMPILED_CHECKS) == [(((True, True),), False)]
+        assert check({"stars": numpy.array([5, 15])}) == {"stars": []}
+        assert other_check({"stars": numpy.array([5, 15])}) == {"stars": [0]}
+
+    def test_must_handle_empty_columns(self):
+        check = jit.compile({"stars": is_int(min=0)})
+        assert check({"stars": numpy.array([], dtype=numpy.int64)}) == {"stars": []}
+
+
+class TestCompileField:
+    def test_must_not_compile_validators_without_bounds(self):
+        assert jit.compile_field(is_int()) is None
+        assert jit.compile_field(is_float(min=0)) is None
+
+    def test_must_return_indices_of_entries_out_of_bounds(self):
+        check = jit.compile_field(is_int(min=0, max=5000))
+        assert check(numpy.array([-1, 0, 5000, 5001])) == [0, 3]
+        assert check(numpy.arange(-5, 100000)) == [0, 1, 2, 3, 4] + list(range(5006, 100005))
@@ -1,6 +1,10 @@
+import functools
 from mock import Mock
+import pytest
 from finicky import ValidationException, is_str, is_int
-from finicky import validate
+from finicky import jit, validators
+from finicky.schema import _JIT_MIN_ROWS
+from finicky import validate, compile_schema, validate_batch
 
 
 class TestSchema:
@@ -59,8 +63,164 @@ class TestSchema:
         _, validated_repo = validate(schema=schema, data=repo, hook=hook)
         assert validated_repo == hook_return_val
 
+    def test_validate_must_support_plain_function_validators(self):
+        def is_version(value):
+            if value.count(".") != 2:
+                raise ValidationException("not a version")
+            return value.strip()
+
+        schema = {"version": is_version, "stars": is_int(min=0)}
+        assert validate(schema=schema, data={"version": " 1.0.0", "stars": "2"}) == (
+            None, {"version": "1.0.0", "stars": 2})
+        assert validate(schema=schema, data={"version": "1.0", "stars": "-2"}) == (
+            {"version": "not a version", "stars": "'-2' is less than minimum allowed (0)"}, {})
+
+    @pytest.mark.parametrize("validate_data", [validate, lambda schema, data: compile_schema(schema)(data)])
+    def test_must_call_wrapped_validators_rather_than_the_validators_they_wrap(self, validate_data):
+        name_validator = is_str()
+
+        @functools.wraps(name_validator)
+        def upper_cased_name(value):
+            return name_validator(value).upper()
+
+        assert validate_data(schema={"name": upper_cased_name}, data={"name": "finicky"}) == (None, {"name": "FINICKY"})
+
+    def test_validate_must_not_modify_input_data(self):
+        repo = {"name": " finicky ", "stars": "2000"}
+        validate(schema={"name": is_str(), "stars": is_int()}, data=repo)
+        assert repo == {"name": " finicky ", "stars": "2000"}
+
+    def test_validate_must_not_return_errors_when_validation_succeeds(self):
+        errors, _ = validate(schema={"name": is_str()}, data={"name": "finicky"})
+        assert errors is None
+
     def test_validate_must_return_newly_validated_data(self):
         repo = {"name": "finicky", "version": "1.0.0", "stars": "2000"}
         schema = {"name": is_str(), "version": is_str(), "stars": is_int()}
         _, validated_repo = validate(schema=schema, data=repo, hook=None)
         assert validated_repo == {"name": "finicky", "version": "1.0.0", "stars": 2000}
+
+
+class TestCompileSchema:
+    def test_compiled_schema_must_run_all_validations_on_fields(self):
+        repo = {"name": "finicky", "version": "1.0.0", "stars": "2000"}
+        schema = {"name": Mock(), "version": Mock(), "stars": Mock()}
+        compile_schema(schema)(repo)
+        schema.get("name").assert_called_once_with(repo.get("name"))
+        schema.get("version").assert_called_once_with(repo.get("version"))
+        schema.get("stars").assert_called_once_with(repo.get("stars"))
+
+    def test_compiled_schema_must_return_validation_errors(self):
+        repo = {"name": "finicky", "version": "1.0.0", "stars": "2000"}
+        error_mock = Mock()
+        error_mock.side_effect = ValidationException("An error occurred")
+        schema = {"name": error_mock, "version": is_str(), "stars": error_mock}
+        errors, _ = compile_schema(schema)(repo)
+        assert errors == {"name": "An error occurred", "stars": "An error occurred"}
+
+    def test_compiled_schema_must_return_newly_validated_data(self):
+        repo = {"name": "finicky", "version": "1.0.0", "stars": "2000", 3: " three "}
+        schema = {"name": is_str(), "version": is_str(), "stars": is_int(), 3: is_str()}
+        _, validated_repo = compile_schema(schema)(repo)
+        assert validated_repo == {"name": "finicky", "version": "1.0.0", "stars": 2000, 3: "three"}
+
+    def test_compiled_schema_must_invoke_hook_only_when_field_validations_succeed(self):
+        schema = {"stars": is_int(min=0)}
+        hook_mock = Mock()
+        compile_schema(schema)({"stars": -1}, hook=hook_mock)
+        hook_mock.assert_not_called()
+        compile_schema(schema)({"stars": 1}, hook=hook_mock)
+        hook_mock.assert_called_once_with({"stars": 1})
+
+    def test_compiled_schema_must_include_hook_errors_in_returned_errors(self):
+        hook_mock = Mock()
+        hook_mock.side_effect = ValidationException("Hook error")
+        errors, _ = compile_schema({"name": is_str()})({"name": "finicky"}, hook=hook_mock)
+        assert errors == {"___hook": "Hook error"}
+
+    def test_must_compile_each_schema_once(self):
+        schema = {"name": is_str()}
+        assert compile_schema(schema) is compile_schema(schema)
+        assert compile_schema(schema) is not compile_schema(dict(schema))
+
+
+class TestValidateBatch:
+    schema = {"name": is_str(required=True), "stars": is_int(min=0, max=5000)}
+
+    @pytest.mark.parametrize("rows", [
+        [{"name": "finicky", "stars": 2000}, {"name": None, "stars": -1}, {"name": "pyval", "stars": 6000}],
+        [{"name": "finicky", "stars": "2000"}, {"name": "pyval", "stars": None}, {"name": " pyval", "stars": 2.5}],
+        [{"name": "finicky", "stars": 2 ** 80}, {"name": "pyval", "stars": True}],
+        []])
+    def test_must_validate_each_row_like_validate(self, rows):
+        errors, validated_rows = validate_batch(schema=self.schema, rows=rows)
+        results = [validate(schema=self.schema, data=row) for row in rows]
+        assert errors == ({index: row_errors for index, (row_errors, _) in enumerate(results) if row_errors} or None)
+        assert validated_rows == [validated_row for _, validated_row in results]
+
+    def test_must_check_int_columns_with_numpy_when_installed(self, monkeypatch):
+        pytest.importorskip("numpy")
+        validator = is_int(min=0, max=5000)
+        check = Mock(wraps=validators._checker(validator))
+        monkeypatch.setitem(validators._BUILTIN_CHECKS, validator, check)
+        errors, validated_rows = validate_batch(schema={"stars": validator}, rows=[{"stars": 1}, {"stars": -1}])
+        assert errors == {1: {"stars": "'-1' is less than minimum allowed (0)"}}
+        assert validated_rows == [{"stars": 1}, {}]
+        check.assert_called_once_with(-1)
+
+    @pytest.mark.parametrize("row_count, compiled", [(_JIT_MIN_ROWS - 1, False), (_JIT_MIN_ROWS, True)])
+    def test_must_only_compile_bounds_checks_for_large_batches(self, monkeypatch, row_count, compiled):
+        pytest.importorskip("numpy")
+        compile_mock = Mock(wraps=jit.compile)
+        monkeypatch.setattr(jit, "compile", compile_mock)
+        rows = [{"stars": index - 1} for index in range(row_count)]
+        errors, _ = validate_batch(schema={"stars": is_int(min=0)}, rows=rows)
+        assert errors == {0: {"stars": "'-1' is less than minimum allowed (0)"}}
+        assert compile_mock.called is compiled
+
+    def test_must_check_bounds_beyond_the_int64_range(self):
+        rows = [{"stars": 1}, {"stars": -1}]
+        assert validate_batch(schema={"stars": is_int(min=0, max=2 ** 64)}, rows=rows) == (
+            {1: {"stars": "'-1' is less than minimum allowed (0)"}}, [{"stars": 1}, {}])
+
+    def test_must_call_wrapped_int_validators_on_each_entry(self):
+        stars_validator = is_int()
+
+        @functools.wraps(stars_validator)
+        def negated_stars(value):
+            return -stars_validator(value)
+
+        assert validate_batch(schema={"stars": negated_stars}, rows=[{"stars": 1}]) == (None, [{"stars": -1}])
+
+    def test_must_validate_the_columns_of_data_frames(self):
+        pandas = pytest.importorskip("pandas")
+        rows = [{"name": "finicky", "stars": 2000}, {"name": None, "stars": -1}, {"name": "pyval", "stars": 6000}]
+        errors, validated_rows = validate_batch(schema=self.schema, rows=pandas.DataFrame(rows))
+        assert (errors, validated_rows) == validate_batch(schema=self.schema, rows=rows)
+        assert all(type(validated_row["stars"]) is int for validated_row in validated_rows if "stars" in validated_row)
+
+    def test_must_pass_missing_values_of_data_frames_as_none(self):
+        pandas = pytest.importorskip("pandas")
+        rows = pandas.DataFrame({"name": ["finicky", None], "stars": pandas.Series([1, None], dtype=object)})
+        errors, validated_rows = validate_batch(schema={"name": is_str(), "stars": is_int(), "forks": is_int()},
+                                                rows=rows)
+        assert errors is None
+        assert validated_rows == [{"name": "finicky", "stars": 1, "forks": None}, {"name": None, "stars": None,
+                                                                                   "forks": None}]
+
+    def test_must_validate_int_columns_of_data_frames_with_missing_values_like_rows(self):
+        pandas = pytest.importorskip("pandas")
+        schema = {"stars": is_int(required=False, min=0), "name": is_str()}
+        rows = [{"stars": 1, "name": "finicky"}, {"stars": None, "name": "pyval"}, {"stars": -1, "name": "val"}]
+        errors, validated_rows = validate_batch(schema=schema, rows=pandas.DataFrame(rows))
+        assert (errors, validated_rows) == validate_batch(schema=schema, rows=rows)
+        assert type(validated_rows[0]["stars"]) is int
+
+    def test_must_invoke_hook_on_each_valid_row(self):
+        hook_mock = Mock()
+        hook_mock.side_effect = [{"name": "changed by hook"}, ValidationException("Hook error")]
+        rows = [{"name": "finicky", "stars": 1}, {"name": "finicky", "stars": -1}, {"name": "pyval", "stars": 2}]
+        errors, validated_rows = validate_batch(schema=self.schema, rows=rows, hook=hook_mock)
+        assert errors == {1: {"stars": "'-1' is less than minimum allowed (0)"}, 2: {"___hook": "Hook error"}}
+        assert validated_rows[0] == {"name": "changed by hook"}
+        assert hook_mock.call_count == 2